@@ -4,12 +4,20 @@ from app_utils.django import clean_setting
 
 from .constants import OperationMode
 
+# Technical parameter: maximum number of rows written to the database
+# in a single bulk query. Tune to the round-trip cost of your database.
+SR_BULK_BATCH_SIZE = clean_setting("SR_BULK_BATCH_SIZE", 2000)
+
 # switch to enable/disable ability to request standings for corporations
 SR_CORPORATIONS_ENABLED = clean_setting("SR_CORPORATIONS_ENABLED", True)
 
 # Number of seconds to cache heavy pages like character and groups standing
 SR_PAGE_CACHE_SECONDS = clean_setting("SR_PAGE_CACHE_SECONDS", 600)
 
+# Technical parameter: number of character IDs sent to the ESI affiliation
+# endpoint per request. Must not exceed the endpoint's cap of 1000 IDs.
+SR_ESI_AFFILIATION_CHUNK = clean_setting("SR_ESI_AFFILIATION_CHUNK", 1000)
+
 # whether ESI requests have a timeout
 SR_ESI_TIMEOUT_ENABLED = clean_setting("SR_ESI_TIMEOUT_ENABLED", True)
 
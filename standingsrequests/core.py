@@ -104,27 +104,11 @@ class ContactType(IntEnum):
 
     @classproperty
     def character_ids(cls):
-        return {
-            cls.CHARACTER_AMARR_TYPE_ID,
-            cls.CHARACTER_NI_KUNNI_TYPE_ID,
-            cls.CHARACTER_CIVRE_TYPE_ID,
-            cls.CHARACTER_DETEIS_TYPE_ID,
-            cls.CHARACTER_GALLENTE_TYPE_ID,
-            cls.CHARACTER_INTAKI_TYPE_ID,
-            cls.CHARACTER_SEBIESTOR_TYPE_ID,
-            cls.CHARACTER_BRUTOR_TYPE_ID,
-            cls.CHARACTER_STATIC_TYPE_ID,
-            cls.CHARACTER_MODIFIER_TYPE_ID,
-            cls.CHARACTER_ACHURA_TYPE_ID,
-            cls.CHARACTER_JIN_MEI_TYPE_ID,
-            cls.CHARACTER_KHANID_TYPE_ID,
-            cls.CHARACTER_VHEROKIOR_TYPE_ID,
-            cls.CHARACTER_DRIFTER_TYPE_ID,
-        }
+        return _CHARACTER_TYPE_IDS
 
     @classproperty
     def corporation_ids(cls):
-        return {cls.CORPORATION_TYPE_ID}
+        return _CORPORATION_TYPE_IDS
 
     @classproperty
     def corporation_id(cls):
@@ -132,7 +116,7 @@ class ContactType(IntEnum):
 
     @classproperty
     def alliance_ids(cls):
-        return {cls.ALLIANCE_TYPE_ID}
+        return _ALLIANCE_TYPE_IDS
 
     @classproperty
     def alliance_id(cls):
@@ -149,3 +133,28 @@ class ContactType(IntEnum):
     @classmethod
     def is_alliance(cls, type_id):
         return type_id in cls.alliance_ids
+
+
+# membership sets are built once at import time, so the frequent
+# type checks do not reconstruct them on every call
+_CHARACTER_TYPE_IDS = frozenset(
+    {
+        ContactType.CHARACTER_AMARR_TYPE_ID,
+        ContactType.CHARACTER_NI_KUNNI_TYPE_ID,
+        ContactType.CHARACTER_CIVRE_TYPE_ID,
+        ContactType.CHARACTER_DETEIS_TYPE_ID,
+        ContactType.CHARACTER_GALLENTE_TYPE_ID,
+        ContactType.CHARACTER_INTAKI_TYPE_ID,
+        ContactType.CHARACTER_SEBIESTOR_TYPE_ID,
+        ContactType.CHARACTER_BRUTOR_TYPE_ID,
+        ContactType.CHARACTER_STATIC_TYPE_ID,
+        ContactType.CHARACTER_MODIFIER_TYPE_ID,
+        ContactType.CHARACTER_ACHURA_TYPE_ID,
+        ContactType.CHARACTER_JIN_MEI_TYPE_ID,
+        ContactType.CHARACTER_KHANID_TYPE_ID,
+        ContactType.CHARACTER_VHEROKIOR_TYPE_ID,
+        ContactType.CHARACTER_DRIFTER_TYPE_ID,
+    }
+)
+_CORPORATION_TYPE_IDS = frozenset({ContactType.CORPORATION_TYPE_ID})
+_ALLIANCE_TYPE_IDS = frozenset({ContactType.ALLIANCE_TYPE_ID})
@@ -4,6 +4,7 @@ from bravado.exception import HTTPError
 
 from django.contrib.auth.models import User
 from django.core.cache import cache
+from esi.models import Token
 from eveuniverse.models import EveEntity
 
 from allianceauth.eveonline.evelinks import eveimageserver
@@ -72,19 +73,26 @@ class EveCorporation:
         """
         from ..models import StandingRequest
 
-        return sum(
-            [
-                1
-                for character in EveCharacter.objects.filter(
-                    character_ownership__user=user
-                )
-                .select_related("character_ownership__user__profile__state")
-                .filter(corporation_id=self.corporation_id)
-                if StandingRequest.has_required_scopes_for_request(
-                    character=character, user=user, quick_check=quick_check
-                )
-            ]
+        character_ids = list(
+            EveCharacter.objects.filter(
+                character_ownership__user=user, corporation_id=self.corporation_id
+            ).values_list("character_id", flat=True)
         )
+        if not character_ids:
+            return 0
+
+        # all characters belong to the same user, so they share the same
+        # required scopes and one token query can cover all of them
+        scopes_string = " ".join(
+            StandingRequest.get_required_scopes_for_state(user.profile.state.name)
+        )
+        token_qs = Token.objects.filter(character_id__in=character_ids).require_scopes(
+            scopes_string
+        )
+        if not quick_check:
+            token_qs = token_qs.require_valid()
+
+        return token_qs.values("character_id").distinct().count()
 
     def user_has_all_member_tokens(self, user: User, quick_check: bool = False) -> bool:
         """returns True if given user owns same amount of token than there are
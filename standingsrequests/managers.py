@@ -1,11 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Tuple
 
 from bravado.exception import HTTPError
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models, transaction
-from django.db.models import Case, Q, Value, When
+from django.db.models import ExpressionWrapper, OuterRef, Q, Subquery
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from esi.models import Token
 from eveuniverse.models import EveEntity
@@ -17,7 +20,11 @@ from app_utils.helpers import chunks
 from app_utils.logging import LoggerAddTag
 
 from . import __title__
-from .app_settings import SR_NOTIFICATIONS_ENABLED
+from .app_settings import (
+    SR_BULK_BATCH_SIZE,
+    SR_ESI_AFFILIATION_CHUNK,
+    SR_NOTIFICATIONS_ENABLED,
+)
 from .constants import OperationMode
 from .core import BaseConfig, ContactType
 from .providers import esi
@@ -50,6 +57,10 @@ class ContactSetManager(models.Manager):
             )
             return None
 
+        # resolve the contact entities before opening the write transaction,
+        # so no ESI calls happen while write locks are held
+        entity_ids = [contact.id for contact in contacts_wrap.contacts]
+        EveEntity.objects.bulk_create_esi(entity_ids)
         with transaction.atomic():
             contacts_set = self.create()
             self._add_labels_from_api(contacts_set, contacts_wrap.labels)
@@ -74,28 +85,50 @@ class ContactSetManager(models.Manager):
     def _add_contacts_from_api(self, contact_set, contacts):
         """Add all contacts to the given ContactSet
         Labels _MUST_ be added before adding contacts
+        and the contact EveEntity objects must already exist
 
         :param contact_set: Django ContactSet to add contacts to
         :param contacts: List of _ContactsWrapper.Contact to add
         """
         from .models import Contact
 
-        for contact in contacts:
-            eve_entity, _ = EveEntity.objects.get_or_create_esi(id=contact.id)
-            obj = Contact.objects.create(
-                contact_set=contact_set,
-                eve_entity=eve_entity,
-                standing=contact.standing,
+        label_pk_by_id = {
+            label.label_id: label.pk for label in contact_set.labels.all()
+        }
+        for contacts_chunk in chunks(contacts, SR_BULK_BATCH_SIZE):
+            Contact.objects.bulk_create(
+                [
+                    Contact(
+                        contact_set=contact_set,
+                        eve_entity_id=contact.id,
+                        standing=contact.standing,
+                    )
+                    for contact in contacts_chunk
+                ]
+            )
+            contact_pk_by_entity_id = dict(
+                contact_set.contacts.filter(
+                    eve_entity_id__in=[contact.id for contact in contacts_chunk]
+                ).values_list("eve_entity_id", "pk")
+            )
+            Contact.labels.through.objects.bulk_create(
+                [
+                    Contact.labels.through(
+                        contact_id=contact_pk_by_entity_id[contact.id],
+                        contactlabel_id=label_pk_by_id[label.id],
+                    )
+                    for contact in contacts_chunk
+                    for label in contact.labels
+                ]
             )
-            flat_labels = [label.id for label in contact.labels]
-            labels = contact_set.labels.filter(label_id__in=flat_labels)
-            obj.labels.add(*labels)
 
 
 class _ContactsWrapper:
     """Converts raw contacts and contact labels data from ESI into an object"""
 
     class Label:
+        __slots__ = ("id", "name")
+
         def __init__(self, json):
             self.id = json["label_id"]
             self.name = json["label_name"]
@@ -107,18 +140,20 @@ class _ContactsWrapper:
             return str(self)
 
     class Contact:
-        def __init__(self, json, labels, names_info):
+        __slots__ = ("id", "name", "standing", "in_watchlist", "label_ids", "labels")
+
+        def __init__(self, json, labels_by_id, names_info):
             self.id = json["contact_id"]
-            self.name = names_info[self.id] if self.id in names_info else ""
+            self.name = names_info.get(self.id, "")
             self.standing = json["standing"]
-            self.in_watchlist = json["in_watchlist"] if "in_watchlist" in json else None
-            self.label_ids = (
-                json["label_ids"]
-                if "label_ids" in json and json["label_ids"] is not None
-                else []
-            )
+            self.in_watchlist = json.get("in_watchlist")
+            self.label_ids = json.get("label_ids") or []
             # list of labels
-            self.labels = [label for label in labels if label.id in self.label_ids]
+            self.labels = [
+                labels_by_id[label_id]
+                for label_id in self.label_ids
+                if label_id in labels_by_id
+            ]
 
         def __str__(self) -> str:
             return str(self.name)
@@ -130,42 +165,56 @@ class _ContactsWrapper:
         self.contacts = []
         self.labels = []
 
-        if BaseConfig.operation_mode is OperationMode.ALLIANCE:
+        operation_mode = BaseConfig.operation_mode
+        access_token = token.valid_access_token()
+        if operation_mode is OperationMode.ALLIANCE:
             if not owner_character.alliance_id:
                 raise RuntimeError(
                     "{owner_character}: owner character is not a member of an alliance"
                 )
-            labels = esi.client.Contacts.get_alliances_alliance_id_contacts_labels(
-                alliance_id=owner_character.alliance_id,
-                token=token.valid_access_token(),
-            ).results()
-            self.labels = [self.Label(label) for label in labels]
-            contacts = esi.client.Contacts.get_alliances_alliance_id_contacts(
+            labels_operation = (
+                esi.client.Contacts.get_alliances_alliance_id_contacts_labels(
+                    alliance_id=owner_character.alliance_id,
+                    token=access_token,
+                )
+            )
+            contacts_operation = esi.client.Contacts.get_alliances_alliance_id_contacts(
                 alliance_id=owner_character.alliance_id,
-                token=token.valid_access_token(),
-            ).results()
-
-        elif BaseConfig.operation_mode is OperationMode.CORPORATON:
-            labels = (
+                token=access_token,
+            )
+        elif operation_mode is OperationMode.CORPORATON:
+            labels_operation = (
                 esi.client.Contacts.get_corporations_corporation_id_contacts_labels(
                     corporation_id=owner_character.corporation_id,
-                    token=token.valid_access_token(),
-                ).results()
+                    token=access_token,
+                )
+            )
+            contacts_operation = (
+                esi.client.Contacts.get_corporations_corporation_id_contacts(
+                    corporation_id=owner_character.corporation_id,
+                    token=access_token,
+                )
             )
-            self.labels = [self.Label(label) for label in labels]
-            contacts = esi.client.Contacts.get_corporations_corporation_id_contacts(
-                corporation_id=owner_character.corporation_id,
-                token=token.valid_access_token(),
-            ).results()
         else:
             raise NotImplementedError()
 
+        # labels and contacts are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            labels_future = executor.submit(labels_operation.results)
+            contacts_future = executor.submit(contacts_operation.results)
+            labels = labels_future.result()
+            contacts = contacts_future.result()
+        self.labels = [self.Label(label) for label in labels]
+
         logger.debug("Got %d contacts in total", len(contacts))
         entity_ids = [contact["contact_id"] for contact in contacts]
-        resolver = EveEntity.objects.bulk_resolve_names(entity_ids)
+        EveEntity.objects.bulk_resolve_names(entity_ids)
+        names_info = dict(
+            EveEntity.objects.filter(id__in=entity_ids).values_list("id", "name")
+        )
+        labels_by_id = {label.id: label for label in self.labels}
         self.contacts = [
-            self.Contact(contact, self.labels, resolver._names_map)
-            for contact in contacts
+            self.Contact(contact, labels_by_id, names_info) for contact in contacts
         ]
 
 
@@ -179,22 +228,36 @@ class ContactQuerySet(models.QuerySet):
     def filter_alliances(self):
         return self.filter(eve_entity__category=EveEntity.CATEGORY_ALLIANCE)
 
+    def with_names(self):
+        """select the eve entity, so accessing its name does not lazy load"""
+        return self.select_related("eve_entity")
+
+    def satisfied_standing_entity_ids(self, contact_ids) -> set:
+        """returns ids of those given entities that have a satisfied standing"""
+        from .models import StandingRequest
+
+        return set(
+            self.filter(
+                eve_entity_id__in=contact_ids,
+                standing__gte=StandingRequest.EXPECT_STANDING_GTEQ,
+                standing__lte=StandingRequest.EXPECT_STANDING_LTEQ,
+            ).values_list("eve_entity_id", flat=True)
+        )
+
 
 class AbstractStandingsRequestQuerySet(models.QuerySet):
     def annotate_is_pending(self) -> models.QuerySet:
         return self.annotate(
-            is_pending_annotated=Case(
-                When(Q(action_date__isnull=True) & Q(is_effective=False), then=True),
-                default=Value(False),
+            is_pending_annotated=ExpressionWrapper(
+                Q(action_date__isnull=True) & Q(is_effective=False),
                 output_field=models.BooleanField(),
             )
         )
 
     def annotate_is_actioned(self) -> models.QuerySet:
         return self.annotate(
-            is_actioned_annotated=Case(
-                When(Q(action_date__isnull=False) & Q(is_effective=False), then=True),
-                default=Value(False),
+            is_actioned_annotated=ExpressionWrapper(
+                Q(action_date__isnull=False) & Q(is_effective=False),
                 output_field=models.BooleanField(),
             )
         )
@@ -214,6 +277,7 @@ class AbstractStandingsRequestManager(models.Manager):
         """Process all the Standing requests/revocation objects"""
         from .models import (
             AbstractStandingsRequest,
+            ContactSet,
             StandingRequest,
             StandingRevocation,
         )
@@ -221,107 +285,177 @@ class AbstractStandingsRequestManager(models.Manager):
         if self.model is AbstractStandingsRequest:
             raise TypeError("Can not be called from abstract objects")
 
+        contact_ids = list(self.values_list("contact_id", flat=True))
+        if not contact_ids:
+            return
+
         organization = BaseConfig.standings_source_entity()
         organization_name = organization.name if organization else ""
-        for standing_request in self.all():
-            contact, dummy = EveEntity.objects.get_or_create_esi(
-                id=standing_request.contact_id
+        # message templates are created once here instead of once per request
+        effective_message_template = _(
+            "'%(organization_name)s' now has blue standing with "
+            "your alt %(contact_category)s '%(contact_name)s'. "
+            "Please also update the standing of "
+            "your %(contact_category)s accordingly."
+        )
+        revoked_message_template = _(
+            "'%(organization_name)s' no longer has "
+            "standing with your "
+            "%(contact_category)s '%(contact_name)s'. "
+            "Please also update the standing of "
+            "your %(contact_category)s accordingly."
+        )
+        EveEntity.objects.bulk_create_esi(contact_ids)
+        contacts = EveEntity.objects.in_bulk(contact_ids)
+        try:
+            latest_contact_set = ContactSet.objects.latest()
+        except ContactSet.DoesNotExist:
+            latest_contact_set = None
+            standing_by_contact_id = {}
+        else:
+            standing_by_contact_id = dict(
+                latest_contact_set.contacts.filter(
+                    eve_entity_id__in=contact_ids
+                ).values_list("eve_entity_id", "standing")
             )
-            is_currently_effective = standing_request.is_effective
-            is_satisfied_standing = standing_request.evaluate_effective_standing()
-            if is_satisfied_standing and not is_currently_effective:
-                if SR_NOTIFICATIONS_ENABLED:
-                    # send notification to user about standing change if enabled
-                    if standing_request.is_standing_request:
-                        notify(
-                            user=standing_request.user,
-                            title=_(
-                                "%s: Standing with %s now in effect"
-                                % (__title__, contact.name)
-                            ),
-                            message=_(
-                                "'%(organization_name)s' now has blue standing with "
-                                "your alt %(contact_category)s '%(contact_name)s'. "
-                                "Please also update the standing of "
-                                "your %(contact_category)s accordingly."
+        latest_contact_set_date = (
+            latest_contact_set.date if latest_contact_set else None
+        )
+        contact_ids_to_purge = []
+        newly_effective_pks = []
+        timed_out_pks = []
+        notifications = []
+        with transaction.atomic():
+            for standing_request in self.select_related("user").iterator(
+                chunk_size=2000
+            ):
+                contact = contacts[standing_request.contact_id]
+                is_currently_effective = standing_request.is_effective
+                # contacts without standing count as neutral
+                is_satisfied_standing = standing_request.is_standing_satisfied(
+                    standing_by_contact_id.get(standing_request.contact_id, 0)
+                )
+                if is_satisfied_standing and not is_currently_effective:
+                    newly_effective_pks.append(standing_request.pk)
+                    if SR_NOTIFICATIONS_ENABLED:
+                        # send notification to user about standing change if enabled
+                        if standing_request.is_standing_request:
+                            notifications.append(
+                                {
+                                    "user": standing_request.user,
+                                    "title": _(
+                                        "%s: Standing with %s now in effect"
+                                        % (__title__, contact.name)
+                                    ),
+                                    "message": effective_message_template
+                                    % {
+                                        "organization_name": organization_name,
+                                        "contact_category": contact.category,
+                                        "contact_name": contact.name,
+                                    },
+                                }
                             )
-                            % {
-                                "organization_name": organization_name,
-                                "contact_category": contact.category,
-                                "contact_name": contact.name,
-                            },
-                        )
-                    elif standing_request.is_standing_revocation:
-                        if standing_request.user:
-                            notify(
-                                user=standing_request.user,
-                                title="%s: Standing with %s revoked"
-                                % (__title__, contact.name),
-                                message=_(
-                                    "'%(organization_name)s' no longer has "
-                                    "standing with your "
-                                    "%(contact_category)s '%(contact_name)s'. "
-                                    "Please also update the standing of "
-                                    "your %(contact_category)s accordingly."
+                        elif standing_request.is_standing_revocation:
+                            if standing_request.user:
+                                notifications.append(
+                                    {
+                                        "user": standing_request.user,
+                                        "title": "%s: Standing with %s revoked"
+                                        % (__title__, contact.name),
+                                        "message": revoked_message_template
+                                        % {
+                                            "organization_name": organization_name,
+                                            "contact_category": contact.category,
+                                            "contact_name": contact.name,
+                                        },
+                                    }
                                 )
+
+                    # if this was a revocation the standing requests need to be
+                    # removed to indicate that this character no longer
+                    # has standing
+                    if standing_request.is_standing_revocation:
+                        contact_ids_to_purge.append(standing_request.contact_id)
+
+                elif is_satisfied_standing:
+                    # Just catching all other contact types (corps/alliances)
+                    # that are set effective
+                    pass
+
+                elif not is_satisfied_standing and is_currently_effective:
+                    # Effective standing no longer effective
+                    logger.info(
+                        "Standing for %d is marked as effective but is not "
+                        "satisfied in game. Deleting." % standing_request.contact_id
+                    )
+                    standing_request.delete(
+                        reason=StandingRevocation.Reason.REVOKED_IN_GAME
+                    )
+
+                else:
+                    # Check the standing hasn't been set actioned
+                    # and not updated in game
+                    actioned_timeout = standing_request.check_actioned_timeout(
+                        latest_date=latest_contact_set_date, commit=False
+                    )
+                    if actioned_timeout is not None and actioned_timeout:
+                        timed_out_pks.append(standing_request.pk)
+                        logger.info(
+                            "Standing request for contact ID %d has timedout "
+                            "and will be reset" % standing_request.contact_id
+                        )
+                        if SR_NOTIFICATIONS_ENABLED:
+                            title = _("Standing Request for %s reset" % contact.name)
+                            message = _(
+                                "The standing request for %(contact_category)s "
+                                "'%(contact_name)s' from %(user_name)s "
+                                "has been reset as it did not appear in "
+                                "game before the timeout period expired."
                                 % {
-                                    "organization_name": organization_name,
                                     "contact_category": contact.category,
                                     "contact_name": contact.name,
+                                    "user_name": standing_request.user.username,
                                 },
                             )
+                            # Notify standing manager
+                            notifications.append(
+                                {
+                                    "user": actioned_timeout,
+                                    "title": title,
+                                    "message": message,
+                                }
+                            )
+                            # Notify the user
+                            notifications.append(
+                                {
+                                    "user": standing_request.user,
+                                    "title": title,
+                                    "message": message,
+                                }
+                            )
 
-                # if this was a revocation the standing requests need to be remove
-                # to indicate that this character no longer has standing
-                if standing_request.is_standing_revocation:
-                    StandingRequest.objects.filter(
-                        contact_id=standing_request.contact_id
-                    ).delete()
-                    StandingRevocation.objects.filter(
-                        contact_id=standing_request.contact_id
-                    ).delete()
-
-            elif is_satisfied_standing:
-                # Just catching all other contact types (corps/alliances)
-                # that are set effective
-                pass
-
-            elif not is_satisfied_standing and is_currently_effective:
-                # Effective standing no longer effective
-                logger.info(
-                    "Standing for %d is marked as effective but is not "
-                    "satisfied in game. Deleting." % standing_request.contact_id
+            if newly_effective_pks:
+                # all rows become effective in one statement
+                self.filter(pk__in=newly_effective_pks).update(
+                    is_effective=True, effective_date=now()
                 )
-                standing_request.delete(
-                    reason=StandingRevocation.Reason.REVOKED_IN_GAME
+            if timed_out_pks:
+                # all timed out rows are reset in one statement
+                self.filter(pk__in=timed_out_pks).update(
+                    action_by=None, action_date=None
                 )
-
-            else:
-                # Check the standing hasn't been set actioned
-                # and not updated in game
-                actioned_timeout = standing_request.check_actioned_timeout()
-                if actioned_timeout is not None and actioned_timeout:
-                    logger.info(
-                        "Standing request for contact ID %d has timedout "
-                        "and will be reset" % standing_request.contact_id
-                    )
-                    if SR_NOTIFICATIONS_ENABLED:
-                        title = _("Standing Request for %s reset" % contact.name)
-                        message = _(
-                            "The standing request for %(contact_category)s "
-                            "'%(contact_name)s' from %(user_name)s "
-                            "has been reset as it did not appear in "
-                            "game before the timeout period expired."
-                            % {
-                                "contact_category": contact.category,
-                                "contact_name": contact.name,
-                                "user_name": standing_request.user.username,
-                            },
-                        )
-                        # Notify standing manager
-                        notify(user=actioned_timeout, title=title, message=message)
-                        # Notify the user
-                        notify(user=standing_request.user, title=title, message=message)
+            if contact_ids_to_purge:
+                StandingRequest.objects.filter(
+                    contact_id__in=contact_ids_to_purge
+                ).delete()
+                StandingRevocation.objects.filter(
+                    contact_id__in=contact_ids_to_purge
+                ).delete()
+
+        # notifications are sent after the transaction has been committed,
+        # so locks are not held while the notification backend is working
+        for notification in notifications:
+            notify(**notification)
 
     def has_pending_request(self, contact_id: int) -> bool:
         """Checks if a request is pending for the given contact_id
@@ -330,7 +464,24 @@ class AbstractStandingsRequestManager(models.Manager):
 
         returns True if a request is already pending, False otherwise
         """
-        return self.pending_requests().filter(contact_id=contact_id).exists()
+        return self.filter(
+            contact_id=contact_id, action_date__isnull=True, is_effective=False
+        ).exists()
+
+    def has_pending_request_bulk(self, contact_ids) -> set:
+        """Checks which of the given contact_ids have a pending request
+
+        contact_ids: contact_ids to check the pending requests for
+
+        returns set of contact_ids that have a pending request
+        """
+        return set(
+            self.filter(
+                contact_id__in=contact_ids,
+                action_date__isnull=True,
+                is_effective=False,
+            ).values_list("contact_id", flat=True)
+        )
 
     def pending_requests(self) -> models.QuerySet:
         """returns all pending requests for this class"""
@@ -350,20 +501,36 @@ class StandingRequestManager(AbstractStandingsRequestManager):
         from .models import StandingRevocation
 
         logger.debug("Validating standings requests")
-        invalid_count = 0
-        for standing_request in self.all():
+        invalid_requests = []
+        has_perm_by_user_id = {}
+        can_request_corporation = {}
+
+        def _can_request_corporation_standing(contact_id, user) -> bool:
+            key = (contact_id, user.pk)
+            if key not in can_request_corporation:
+                can_request_corporation[key] = (
+                    self.model.can_request_corporation_standing(contact_id, user)
+                )
+            return can_request_corporation[key]
+
+        for standing_request in self.select_related("user").iterator(chunk_size=2000):
             logger.debug(
                 "Checking request for contact_id %d", standing_request.contact_id
             )
+            user = standing_request.user
+            if user.pk not in has_perm_by_user_id:
+                has_perm_by_user_id[user.pk] = user.has_perm(
+                    self.model.REQUEST_PERMISSION_NAME
+                )
             reason = StandingRevocation.Reason.NONE
-            if not standing_request.user.has_perm(self.model.REQUEST_PERMISSION_NAME):
+            if not has_perm_by_user_id[user.pk]:
                 logger.debug("Request is invalid, user does not have permission")
                 reason = StandingRevocation.Reason.LOST_PERMISSION
                 is_valid = False
 
             elif ContactType.is_corporation(
                 standing_request.contact_type_id
-            ) and not self.model.can_request_corporation_standing(
+            ) and not _can_request_corporation_standing(
                 standing_request.contact_id, standing_request.user
             ):
                 logger.debug("Request is invalid, not all corp API keys recorded.")
@@ -374,26 +541,34 @@ class StandingRequestManager(AbstractStandingsRequestManager):
                 is_valid = True
 
             if not is_valid:
-                logger.info(
-                    "Standing request for contact_id %d no longer valid. "
-                    "Creating revocation",
-                    standing_request.contact_id,
-                )
-                StandingRevocation.objects.add_revocation(
-                    contact_id=standing_request.contact_id,
-                    contact_type=self.model.contact_id_2_type(
-                        standing_request.contact_type_id
-                    ),
-                    user=standing_request.user,
-                    reason=reason,
-                )
-                invalid_count += 1
+                invalid_requests.append((standing_request, reason))
+
+        if invalid_requests:
+            with transaction.atomic():
+                for standing_request, reason in invalid_requests:
+                    logger.info(
+                        "Standing request for contact_id %d no longer valid. "
+                        "Creating revocation",
+                        standing_request.contact_id,
+                    )
+                    StandingRevocation.objects.add_revocation(
+                        contact_id=standing_request.contact_id,
+                        contact_type=self.model.contact_id_2_type(
+                            standing_request.contact_type_id
+                        ),
+                        user=standing_request.user,
+                        reason=reason,
+                    )
 
-        return invalid_count
+        return len(invalid_requests)
 
     def create_character_request(self, user: User, character: EveCharacter) -> bool:
         """Create new character standings request for user if possible."""
-        from .models import ContactSet, StandingRequest, StandingRevocation
+        from .models import (
+            AbstractStandingsRequest,
+            ContactSet,
+            StandingRequest,
+        )
 
         try:
             if character.character_ownership.user != user:
@@ -409,9 +584,7 @@ class StandingRequestManager(AbstractStandingsRequestManager):
             logger.warning("Failed to get a contact set")
             return False
         character_id = character.character_id
-        if StandingRequest.objects.has_pending_request(
-            character_id
-        ) or StandingRevocation.objects.has_pending_request(character_id):
+        if AbstractStandingsRequest.objects.has_pending_request(character_id):
             logger.warning("%s: Character already has a pending request", character)
             return False
         elif not StandingRequest.has_required_scopes_for_request(
@@ -431,11 +604,9 @@ class StandingRequestManager(AbstractStandingsRequestManager):
 
     def create_corporation_request(self, user, corporation_id) -> bool:
         """Create new corporation standings request for user if possible."""
-        from .models import StandingRequest, StandingRevocation
+        from .models import AbstractStandingsRequest, StandingRequest
 
-        if StandingRequest.objects.has_pending_request(
-            corporation_id
-        ) or StandingRevocation.objects.has_pending_request(corporation_id):
+        if AbstractStandingsRequest.objects.has_pending_request(corporation_id):
             logger.warning(
                 "Contact ID %d already has a pending request", corporation_id
             )
@@ -492,21 +663,25 @@ class StandingRevocationManager(AbstractStandingsRequestManager):
             contact_type,
         )
         contact_type_id = self.model.contact_type_2_id(contact_type)
-        if self.has_pending_request(contact_id):
+        if not reason:
+            reason = self.model.Reason.NONE
+        instance, created = self.get_or_create(
+            contact_id=contact_id,
+            action_date=None,
+            is_effective=False,
+            defaults={
+                "contact_type_id": contact_type_id,
+                "user": user,
+                "reason": reason,
+            },
+        )
+        if not created:
             logger.debug(
                 "Cannot add revocation for contact %d %s, pending revocation exists",
                 contact_id,
                 contact_type_id,
             )
             return None
-        if not reason:
-            reason = self.model.Reason.NONE
-        instance = self.create(
-            contact_id=contact_id,
-            contact_type_id=contact_type_id,
-            user=user,
-            reason=reason,
-        )
         return instance
 
 
@@ -514,21 +689,15 @@ class CharacterAffiliationManager(models.Manager):
     def update_evecharacter_relations(self) -> None:
         """Update links to eve character in auth if any"""
 
-        eve_character_id_map = {
-            obj["character_id"]: obj["id"]
-            for obj in EveCharacter.objects.values("id", "character_id")
-        }
-        with transaction.atomic():
-            affiliations = [
-                obj for obj in self.filter(character_id__in=eve_character_id_map.keys())
-            ]
-            for affiliation in affiliations:
-                affiliation.eve_character_id = eve_character_id_map[
-                    affiliation.character_id
-                ]
-            self.bulk_update(
-                objs=affiliations, fields=["eve_character_id"], batch_size=500
+        self.filter(
+            character_id__in=Subquery(EveCharacter.objects.values("character_id"))
+        ).update(
+            eve_character_id=Subquery(
+                EveCharacter.objects.filter(
+                    character_id=OuterRef("character_id")
+                ).values("id")[:1]
             )
+        )
 
     def update_from_esi(self) -> None:
         """Update all character affiliations we have contacts or requests for."""
@@ -547,105 +716,143 @@ class CharacterAffiliationManager(models.Manager):
             logger.warning("Could not find a contact set")
             return []
 
-        character_ids_contacts = set(
+        character_ids = (
             contact_set.contacts.filter_characters()
             .values_list("eve_entity_id", flat=True)
-            .distinct()
-        )
-        character_ids_requests = set(
-            StandingRequest.objects.filter_characters()
-            .values_list("contact_id", flat=True)
-            .distinct()
-        )
-        character_ids_revocations = set(
-            StandingRevocation.objects.filter_characters()
-            .values_list("contact_id", flat=True)
-            .distinct()
-        )
-        return list(
-            character_ids_contacts | character_ids_requests | character_ids_revocations
+            .union(
+                StandingRequest.objects.filter_characters().values_list(
+                    "contact_id", flat=True
+                ),
+                StandingRevocation.objects.filter_characters().values_list(
+                    "contact_id", flat=True
+                ),
+            )
         )
+        return list(character_ids)
 
     def _fetch_characters_affiliation_from_esi(self, character_ids) -> list:
-        chunk_size = 1000
+        def fetch_chunk(character_ids_chunk) -> list:
+            return esi.client.Character.post_characters_affiliation(
+                characters=character_ids_chunk
+            ).results()
+
         affiliations = []
-        for character_ids_chunk in chunks(character_ids, chunk_size):
-            try:
-                response = esi.client.Character.post_characters_affiliation(
-                    characters=character_ids_chunk
-                ).results()
-            except HTTPError:
-                logger.exception("Could not fetch character affiliations from ESI")
-                return []
-            else:
-                affiliations += response
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(fetch_chunk, character_ids_chunk)
+                for character_ids_chunk in chunks(
+                    character_ids, SR_ESI_AFFILIATION_CHUNK
+                )
+            ]
+            for future in as_completed(futures):
+                try:
+                    affiliations += future.result()
+                except HTTPError:
+                    logger.exception("Could not fetch character affiliations from ESI")
+                    return []
         return affiliations
 
     def _store_affiliations(self, affiliations) -> None:
-        affiliation_objects = list()
+        entity_ids = set()
         for affiliation in affiliations:
-            character, _ = EveEntity.objects.get_or_create(
-                id=affiliation["character_id"]
-            )
-            corporation, _ = EveEntity.objects.get_or_create(
-                id=affiliation["corporation_id"]
-            )
+            entity_ids.add(affiliation["character_id"])
+            entity_ids.add(affiliation["corporation_id"])
             if affiliation.get("alliance_id"):
-                alliance, _ = EveEntity.objects.get_or_create(
-                    id=affiliation["alliance_id"]
-                )
-            else:
-                alliance = None
+                entity_ids.add(affiliation["alliance_id"])
             if affiliation.get("faction_id"):
-                faction, _ = EveEntity.objects.get_or_create(
-                    id=affiliation["faction_id"]
-                )
-            else:
-                faction = None
-            affiliation_objects.append(
-                self.model(
-                    character=character,
-                    corporation=corporation,
-                    alliance=alliance,
-                    faction=faction,
+                entity_ids.add(affiliation["faction_id"])
+        EveEntity.objects.bulk_create_esi(entity_ids)
+        existing = {
+            obj.character_id: obj
+            for obj in self.all()
+            .only("character_id", "corporation_id", "alliance_id", "faction_id")
+            .iterator(chunk_size=2000)
+        }
+        to_create = []
+        to_update = []
+        for affiliation in affiliations:
+            corporation_id = affiliation["corporation_id"]
+            alliance_id = affiliation.get("alliance_id")
+            faction_id = affiliation.get("faction_id")
+            obj = existing.pop(affiliation["character_id"], None)
+            if obj is None:
+                to_create.append(
+                    self.model(
+                        character_id=affiliation["character_id"],
+                        corporation_id=corporation_id,
+                        alliance_id=alliance_id,
+                        faction_id=faction_id,
+                    )
                 )
-            )
+            elif (obj.corporation_id, obj.alliance_id, obj.faction_id) != (
+                corporation_id,
+                alliance_id,
+                faction_id,
+            ):
+                obj.corporation_id = corporation_id
+                obj.alliance_id = alliance_id
+                obj.faction_id = faction_id
+                to_update.append(obj)
         with transaction.atomic():
-            self.all().delete()
-            self.bulk_create(affiliation_objects, batch_size=500)
-
-        EveEntity.objects.bulk_create_esi(
-            filter(
-                lambda x: x is not None,
-                [
-                    affiliation["character_id"],
-                    affiliation["corporation_id"],
-                    affiliation["alliance_id"],
-                ],
-            )
-        )
+            if existing:  # affiliations no longer tracked
+                self.filter(character_id__in=existing.keys()).delete()
+            if to_update:
+                self.bulk_update(
+                    to_update,
+                    fields=["corporation_id", "alliance_id", "faction_id"],
+                    batch_size=SR_BULK_BATCH_SIZE,
+                )
+            if to_create:
+                self.bulk_create(to_create, batch_size=SR_BULK_BATCH_SIZE)
 
 
 class CorporationDetailsManager(models.Manager):
+    CORPORATION_IDS_CACHE_KEY = "STANDINGS_REQUESTS_CORPORATION_IDS_FROM_CONTACTS_%d"
+    CORPORATION_IDS_CACHE_TIME = 60 * 5  # 5 minutes
+
     def corporation_ids_from_contacts(self) -> set:
-        from .models import Contact
+        """returns corporation ids gathered from the contacts,
+        both from corporation contacts and from character contact affiliations
+
+        The result is cached per contact set, since the underlying joins
+        are expensive and the contacts only change with a new standings pull.
+        """
+        from .models import ContactSet
+
+        try:
+            latest_contact_set_pk = ContactSet.objects.latest().pk
+        except ContactSet.DoesNotExist:
+            return self._gather_corporation_ids_from_contacts()
+
+        cache_key = self.CORPORATION_IDS_CACHE_KEY % latest_contact_set_pk
+        corporation_ids = cache.get(cache_key)
+        if corporation_ids is None:
+            corporation_ids = self._gather_corporation_ids_from_contacts()
+            cache.set(cache_key, corporation_ids, self.CORPORATION_IDS_CACHE_TIME)
+        return corporation_ids
+
+    def _gather_corporation_ids_from_contacts(self) -> set:
+        from .models import CharacterAffiliation, Contact
 
         contact_corporation_ids = set(
             Contact.objects.filter_corporations().values_list(
                 "eve_entity_id", flat=True
             )
         )
+        # two indexed queries instead of joining contacts with affiliations
+        character_contact_ids = set(
+            Contact.objects.filter_characters().values_list("eve_entity_id", flat=True)
+        )
         character_affiliation_corporation_ids = set(
-            Contact.objects.filter_characters().values_list(
-                "eve_entity__character_affiliation__corporation_id", flat=True
-            )
+            CharacterAffiliation.objects.filter(
+                character_id__in=character_contact_ids
+            ).values_list("corporation_id", flat=True)
         )
-        return set(
-            filter(
-                lambda x: x is not None,
-                contact_corporation_ids | character_affiliation_corporation_ids,
-            )
+        corporation_ids = (
+            contact_corporation_ids | character_affiliation_corporation_ids
         )
+        corporation_ids.discard(None)
+        return corporation_ids
 
     def update_or_create_from_esi(self, id: int) -> Tuple[models.Model, bool]:
         """Updates or create an obj from ESI"""
@@ -653,30 +860,33 @@ class CorporationDetailsManager(models.Manager):
         data = esi.client.Corporation.get_corporations_corporation_id(
             corporation_id=id
         ).results()
-        corporation = EveEntity.objects.get_or_create(id=id)[0]
-        alliance = (
-            EveEntity.objects.get_or_create(id=data["alliance_id"])[0]
-            if data.get("alliance_id")
-            else None
-        )
-        ceo = EveEntity.objects.get_or_create(id=data["ceo_id"])[0]
-        faction = (
-            EveEntity.objects.get_or_create(id=data["faction_id"])[0]
-            if data.get("faction_id")
-            else None
-        )
-        EveEntity.objects.bulk_create_esi(
-            filter(
-                lambda x: x is not None,
-                [id, data.get("alliance_id"), data["ceo_id"], data.get("faction_id")],
+        entity_ids = [
+            entity_id
+            for entity_id in (
+                id,
+                data.get("alliance_id"),
+                data["ceo_id"],
+                data.get("faction_id"),
             )
+            if entity_id
+        ]
+        # pre-create placeholders for ids already supplied by the corporation
+        # endpoint, so bulk_create_esi does not fetch them again
+        existing_entity_ids = set(
+            EveEntity.objects.filter(id__in=entity_ids).values_list("id", flat=True)
+        )
+        EveEntity.objects.bulk_create(
+            EveEntity(id=entity_id)
+            for entity_id in entity_ids
+            if entity_id not in existing_entity_ids
         )
+        EveEntity.objects.bulk_create_esi(entity_ids)
         return self.update_or_create(
-            corporation=corporation,
+            corporation_id=id,
             defaults={
-                "alliance": alliance,
-                "ceo": ceo,
-                "faction": faction,
+                "alliance_id": data.get("alliance_id"),
+                "ceo_id": data["ceo_id"],
+                "faction_id": data.get("faction_id"),
                 "member_count": data["member_count"],
                 "ticker": data["ticker"],
             },
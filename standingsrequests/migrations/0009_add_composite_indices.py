@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("standingsrequests", "0008_add_revocation_reason"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="abstractstandingsrequest",
+            index=models.Index(
+                fields=["is_effective", "action_date"],
+                name="stdreq_effective_action_idx",
+            ),
+        ),
+    ]
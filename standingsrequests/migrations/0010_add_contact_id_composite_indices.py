@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("standingsrequests", "0009_add_composite_indices"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="abstractstandingsrequest",
+            name="contact_id",
+            field=models.PositiveIntegerField(
+                help_text="EVE Online ID of contact this standing is for"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="abstractstandingsrequest",
+            index=models.Index(
+                fields=["contact_id", "is_effective"],
+                name="stdreq_contact_effective_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="abstractstandingsrequest",
+            index=models.Index(
+                fields=["contact_id", "action_date"],
+                name="stdreq_contact_action_idx",
+            ),
+        ),
+    ]
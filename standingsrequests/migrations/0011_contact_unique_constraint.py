@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_contacts(apps, schema_editor):
+    """Remove duplicate contacts, keeping the oldest row of each pair."""
+    Contact = apps.get_model("standingsrequests", "Contact")
+    duplicates = (
+        Contact.objects.values("contact_set_id", "eve_entity_id")
+        .annotate(min_pk=Min("pk"), num_rows=Count("pk"))
+        .filter(num_rows__gt=1)
+    )
+    for duplicate in duplicates:
+        Contact.objects.filter(
+            contact_set_id=duplicate["contact_set_id"],
+            eve_entity_id=duplicate["eve_entity_id"],
+        ).exclude(pk=duplicate["min_pk"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("standingsrequests", "0010_add_contact_id_composite_indices"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_contacts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(
+                fields=["contact_set", "eve_entity"], name="contact_set_entity_uniq"
+            ),
+        ),
+    ]
@@ -1,8 +1,7 @@
 from datetime import timedelta
 
 from django.contrib.auth.models import User
-from django.core import exceptions
-from django.db import models
+from django.db import models, transaction
 from django.utils.functional import cached_property
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
@@ -31,6 +30,30 @@ from .managers import (
 
 logger = LoggerAddTag(get_extension_logger(__name__), __title__)
 
+# canonical EVE type ID for each requestable contact type
+_CONTACT_TYPE_ID_BY_NAME = {
+    "character": ContactType.character_id,
+    "corporation": ContactType.corporation_id,
+}
+
+# contact type name for each known EVE type ID
+_CONTACT_TYPE_NAME_BY_ID = {
+    **{type_id: "character" for type_id in ContactType.character_ids},
+    **{type_id: "corporation" for type_id in ContactType.corporation_ids},
+}
+
+
+# required ESI scope for each supported operation mode
+_ESI_SCOPE_BY_OPERATION_MODE = {
+    OperationMode.ALLIANCE: "esi-alliances.read_contacts.v1",
+    OperationMode.CORPORATON: "esi-corporations.read_contacts.v1",
+}
+
+
+def _required_scopes_string(state_name: str) -> str:
+    """joined required scopes for the given state"""
+    return " ".join(StandingRequest.get_required_scopes_for_state(state_name))
+
 
 class ContactSet(models.Model):
     """Set of contacts from configured alliance or corporation
@@ -57,11 +80,11 @@ class ContactSet(models.Model):
 
     def contact_has_satisfied_standing(self, contact_id: int) -> bool:
         """Return True if give contact has standing exists"""
-        try:
-            contact = self.contacts.get(eve_entity_id=contact_id)
-        except Contact.DoesNotExist:
-            return False
-        return contact.is_standing_satisfied
+        return self.contacts.filter(
+            eve_entity_id=contact_id,
+            standing__gte=StandingRequest.EXPECT_STANDING_GTEQ,
+            standing__lte=StandingRequest.EXPECT_STANDING_LTEQ,
+        ).exists()
 
     def generate_standing_requests_for_blue_alts(self) -> int:
         """Automatically creates effective standings requests for
@@ -72,35 +95,45 @@ class ContactSet(models.Model):
         logger.info("Started generating standings request for blue alts.")
         owned_characters_qs = EveCharacter.objects.filter(
             character_ownership__isnull=False
+        ).select_related("character_ownership__user")
+        alt_ids = list(owned_characters_qs.values_list("character_id", flat=True))
+        existing_request_ids = set(
+            StandingRequest.objects.filter(contact_id__in=alt_ids).values_list(
+                "contact_id", flat=True
+            )
+        )
+        existing_revocation_ids = set(
+            StandingRevocation.objects.filter(contact_id__in=alt_ids).values_list(
+                "contact_id", flat=True
+            )
         )
-        created_counter = 0
-        for alt in owned_characters_qs:
-            user = alt.character_ownership.user
+        satisfied_standing_ids = self.contacts.satisfied_standing_entity_ids(alt_ids)
+        eligible_alts = [
+            alt
+            for alt in owned_characters_qs.iterator(chunk_size=2000)
             if (
-                not MainOrganizations.is_character_a_member(alt)
-                and not StandingRequest.objects.filter(
-                    user=user, contact_id=alt.character_id
-                ).exists()
-                and not StandingRevocation.objects.filter(
-                    contact_id=alt.character_id
-                ).exists()
-                and self.contact_has_satisfied_standing(alt.character_id)
-            ):
-                sr = StandingRequest.objects.get_or_create_2(
-                    user=user,
+                alt.character_id not in existing_request_ids
+                and alt.character_id not in existing_revocation_ids
+                and alt.character_id in satisfied_standing_ids
+                and not MainOrganizations.is_character_a_member(alt)
+            )
+        ]
+        # rows are created fully initialized, which replaces the former
+        # get_or_create / mark_actioned / mark_effective write sequence.
+        # bulk_create is not an option for multi table inheritance models.
+        creation_date = now()
+        with transaction.atomic():
+            for alt in eligible_alts:
+                StandingRequest.objects.create(
+                    user=alt.character_ownership.user,
                     contact_id=alt.character_id,
-                    contact_type=StandingRequest.CHARACTER_CONTACT_TYPE,
-                )
-                sr.mark_actioned(None)
-                sr.mark_effective()
-                logger.info(
-                    "Generated standings request for blue alt %s "
-                    "belonging to user %s.",
-                    alt,
-                    user,
+                    contact_type_id=ContactType.character_id,
+                    action_date=creation_date,
+                    is_effective=True,
+                    effective_date=creation_date,
                 )
-                created_counter += 1
 
+        created_counter = len(eligible_alts)
         logger.info(
             "Completed generating %d standings request for blue alts.",
             created_counter,
@@ -110,12 +143,10 @@ class ContactSet(models.Model):
     @staticmethod
     def required_esi_scope() -> str:
         """returns the required ESI scopes for syncing"""
-        if BaseConfig.operation_mode is OperationMode.ALLIANCE:
-            return "esi-alliances.read_contacts.v1"
-        elif BaseConfig.operation_mode is OperationMode.CORPORATON:
-            return "esi-corporations.read_contacts.v1"
-        else:
-            raise NotImplementedError()
+        try:
+            return _ESI_SCOPE_BY_OPERATION_MODE[BaseConfig.operation_mode]
+        except KeyError:
+            raise NotImplementedError() from None
 
 
 class ContactLabel(models.Model):
@@ -152,6 +183,13 @@ class Contact(models.Model):
 
     objects = ContactQuerySet.as_manager()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["contact_set", "eve_entity"], name="contact_set_entity_uniq"
+            )
+        ]
+
     def __str__(self):
         return self.eve_entity.name
 
@@ -188,7 +226,7 @@ class AbstractStandingsRequest(models.Model):
     REQUEST_PERMISSION_NAME = "standingsrequests.request_standings"
 
     contact_id = models.PositiveIntegerField(
-        db_index=True, help_text="EVE Online ID of contact this standing is for"
+        help_text="EVE Online ID of contact this standing is for"
     )
     contact_type_id = models.PositiveIntegerField(
         db_index=True, help_text="EVE Online Type ID of this contact"
@@ -223,6 +261,23 @@ class AbstractStandingsRequest(models.Model):
             ("affect_standings", "User can process standings requests."),
             ("request_standings", "User can request standings."),
         )
+        indexes = [
+            # covers the pending requests lookups
+            models.Index(
+                fields=["is_effective", "action_date"],
+                name="stdreq_effective_action_idx",
+            ),
+            # cover the per-contact existence checks,
+            # which replace the single-column index on contact_id
+            models.Index(
+                fields=["contact_id", "is_effective"],
+                name="stdreq_contact_effective_idx",
+            ),
+            models.Index(
+                fields=["contact_id", "action_date"],
+                name="stdreq_contact_action_idx",
+            ),
+        ]
 
     def __repr__(self) -> str:
         try:
@@ -235,11 +290,11 @@ class AbstractStandingsRequest(models.Model):
             f"{user_str}, is_effective={self.is_effective})"
         )
 
-    @property
+    @cached_property
     def is_character(self) -> bool:
         return ContactType.is_character(self.contact_type_id)
 
-    @property
+    @cached_property
     def is_corporation(self) -> bool:
         return ContactType.is_corporation(self.contact_type_id)
 
@@ -251,13 +306,9 @@ class AbstractStandingsRequest(models.Model):
     def is_pending(self) -> bool:
         return self.action_date is None and self.is_effective is False
 
-    @property
-    def is_standing_request(self) -> bool:
-        return type(self) is StandingRequest
-
-    @property
-    def is_standing_revocation(self) -> bool:
-        return type(self) is StandingRevocation
+    # class constants overridden by the concrete subclasses
+    is_standing_request = False
+    is_standing_revocation = False
 
     @classmethod
     def is_standing_satisfied(cls, standing: float) -> bool:
@@ -270,50 +321,55 @@ class AbstractStandingsRequest(models.Model):
 
     @classmethod
     def contact_type_2_id(cls, contact_type) -> int:
-        if contact_type == cls.CHARACTER_CONTACT_TYPE:
-            return ContactType.character_id
-        elif contact_type == cls.CORPORATION_CONTACT_TYPE:
-            return ContactType.corporation_id
-        else:
-            raise ValueError("Invalid contact type")
+        try:
+            return _CONTACT_TYPE_ID_BY_NAME[contact_type]
+        except KeyError:
+            raise ValueError("Invalid contact type") from None
 
     @classmethod
     def contact_id_2_type(cls, contact_type_id) -> str:
-        if contact_type_id in ContactType.character_ids:
-            return cls.CHARACTER_CONTACT_TYPE
-        elif contact_type_id in ContactType.corporation_ids:
-            return cls.CORPORATION_CONTACT_TYPE
-        else:
-            raise ValueError("Invalid contact type")
+        try:
+            return _CONTACT_TYPE_NAME_BY_ID[contact_type_id]
+        except KeyError:
+            raise ValueError("Invalid contact type") from None
 
-    def evaluate_effective_standing(self, check_only: bool = False) -> bool:
+    def evaluate_effective_standing(
+        self, check_only: bool = False, contact_set=None
+    ) -> bool:
         """
         Check and mark a standing as satisfied
         :param check_only: Check the standing only, take no action
+        :param contact_set: contact set to evaluate against,
+        defaults to the latest - batch callers should pass it in
         """
-        try:
-            logger.debug("Checking standing for %d", self.contact_id)
-            latest = ContactSet.objects.latest()
-            contact = latest.contacts.get(eve_entity_id=self.contact_id)
-            if self.is_standing_satisfied(contact.standing):
-                # Standing is satisfied
-                logger.debug("Standing satisfied for %d", self.contact_id)
-                if not check_only:
-                    self.mark_effective()
-                return True
-
-        except exceptions.ObjectDoesNotExist:
+        logger.debug("Checking standing for %d", self.contact_id)
+        if contact_set is None:
+            try:
+                contact_set = ContactSet.objects.latest()
+            except ContactSet.DoesNotExist:
+                contact_set = None
+        if contact_set is None:
+            standing = None
+        else:
+            # only the standing value is needed, not the full contact row
+            standing = (
+                contact_set.contacts.filter(eve_entity_id=self.contact_id)
+                .values_list("standing", flat=True)
+                .first()
+            )
+        if standing is None:
+            # contact not found, checking if neutral is OK
             logger.debug(
                 "No standing set for %d, checking if neutral is OK", self.contact_id
             )
-            if self.is_standing_satisfied(0):
-                # Standing satisfied but deleted (neutral)
-                logger.debug(
-                    "Standing satisfied but deleted (neutral) for %d", self.contact_id
-                )
-                if not check_only:
-                    self.mark_effective()
-                return True
+            standing = 0
+
+        if self.is_standing_satisfied(standing):
+            # Standing is satisfied
+            logger.debug("Standing satisfied for %d", self.contact_id)
+            if not check_only:
+                self.mark_effective()
+            return True
 
         # Standing not satisfied
         logger.debug("Standing NOT satisfied for %d", self.contact_id)
@@ -329,7 +385,7 @@ class AbstractStandingsRequest(models.Model):
         logger.debug("Marking standing for %d as effective", self.contact_id)
         self.is_effective = True
         self.effective_date = date if date else now()
-        self.save()
+        self.save(update_fields=["is_effective", "effective_date"])
 
     def mark_actioned(self, user, date=None):
         """
@@ -342,12 +398,16 @@ class AbstractStandingsRequest(models.Model):
         logger.debug("Marking standing for %d as actioned", self.contact_id)
         self.action_by = user
         self.action_date = date if date else now()
-        self.save()
+        self.save(update_fields=["action_by", "action_date"])
 
-    def check_actioned_timeout(self):
+    def check_actioned_timeout(self, latest_date=None, commit=True):
         """
         Check that a standing hasn't been marked as actioned
         and is still not effective ~24hr later
+        :param latest_date: date of the latest contact set,
+        will be fetched when not provided
+        :param commit: when False the caller is responsible
+        for saving the reset row
         :return: User if the actioned has timed out, False if it has not,
         None if the check was unsuccessful
         """
@@ -360,14 +420,15 @@ class AbstractStandingsRequest(models.Model):
             logger.debug("Standing was never actioned, cannot timeout")
             return None
 
-        try:
-            latest = ContactSet.objects.latest()
-        except ContactSet.DoesNotExist:
-            logger.debug("Cannot check standing timeout, no standings available")
-            return None
+        if latest_date is None:
+            try:
+                latest_date = ContactSet.objects.latest().date
+            except ContactSet.DoesNotExist:
+                logger.debug("Cannot check standing timeout, no standings available")
+                return None
 
         # Reset request that has not become effective after timeout expired
-        if self.action_date + timedelta(hours=SR_STANDING_TIMEOUT_HOURS) < latest.date:
+        if self.action_date + timedelta(hours=SR_STANDING_TIMEOUT_HOURS) < latest_date:
             logger.info(
                 "Standing actioned timed out, resetting actioned for contact_id %d",
                 self.contact_id,
@@ -375,7 +436,8 @@ class AbstractStandingsRequest(models.Model):
             actioner = self.action_by
             self.action_by = None
             self.action_date = None
-            self.save()
+            if commit:
+                self.save(update_fields=["action_by", "action_date"])
             return actioner
         return False
 
@@ -389,7 +451,9 @@ class AbstractStandingsRequest(models.Model):
         self.effective_date = None
         self.action_by = None
         self.action_date = None
-        self.save()
+        self.save(
+            update_fields=["is_effective", "effective_date", "action_by", "action_date"]
+        )
 
 
 class StandingRequest(AbstractStandingsRequest):
@@ -405,6 +469,8 @@ class StandingRequest(AbstractStandingsRequest):
 
     EXPECT_STANDING_GTEQ = 0.01
 
+    is_standing_request = True
+
     user = models.ForeignKey(User, on_delete=models.CASCADE)
 
     objects = StandingRequestManager()
@@ -420,7 +486,10 @@ class StandingRequest(AbstractStandingsRequest):
     def _remove_character_standing(self) -> bool:
         """Remove effective character standing for user if possible."""
         try:
-            character = EveCharacter.objects.get(character_id=self.contact_id)
+            # the membership check only needs the affiliation ids
+            character = EveCharacter.objects.only(
+                "character_id", "corporation_id", "alliance_id"
+            ).get(character_id=self.contact_id)
         except EveCharacter.DoesNotExist:
             return False
         if MainOrganizations.is_character_a_member(character):
@@ -553,7 +622,7 @@ class StandingRequest(AbstractStandingsRequest):
                 user = ownership.user
 
         state_name = user.profile.state.name
-        scopes_string = " ".join(cls.get_required_scopes_for_state(state_name))
+        scopes_string = _required_scopes_string(state_name)
         token_qs = Token.objects.filter(
             character_id=character.character_id
         ).require_scopes(scopes_string)
@@ -562,6 +631,31 @@ class StandingRequest(AbstractStandingsRequest):
 
         return token_qs.exists()
 
+    @classmethod
+    def characters_with_required_scopes_for_request(
+        cls, characters, user: User, quick_check: bool = False
+    ) -> set:
+        """returns ids of those given characters that have the required
+        scopes for issueing a standings request
+
+        Params:
+        - characters: characters to check, all owned by the given user
+        - user: user owning the characters
+        - quick_check: if True will not check if tokens are valid to save time
+        """
+        character_ids = {character.character_id for character in characters}
+        if not character_ids:
+            return set()
+
+        scopes_string = _required_scopes_string(user.profile.state.name)
+        token_qs = Token.objects.filter(character_id__in=character_ids).require_scopes(
+            scopes_string
+        )
+        if not quick_check:
+            token_qs = token_qs.require_valid()
+
+        return set(token_qs.values_list("character_id", flat=True))
+
     @staticmethod
     def get_required_scopes_for_state(state_name: str) -> list:
         state_name = "" if not state_name else state_name
@@ -577,6 +671,8 @@ class StandingRevocation(AbstractStandingsRequest):
 
     EXPECT_STANDING_LTEQ = 0.0
 
+    is_standing_revocation = True
+
     class Reason(models.TextChoices):
         """Reason for revoking a standing."""
 
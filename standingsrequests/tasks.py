@@ -142,8 +142,6 @@ def purge_stale_standings_data():
             # because with lots of them it uses lots of memory
             # lets go over them one by one and delete
             for contact_set in stale_contacts_qs:
-                Contact.objects.filter(contact_set=contact_set).delete()
-                Contact.objects.filter(contact_set=contact_set).delete()
                 Contact.objects.filter(contact_set=contact_set).delete()
                 ContactLabel.objects.filter(contact_set=contact_set).delete()
 
@@ -1,7 +1,7 @@
 import inspect
 import json
 import os
-from copy import deepcopy
+from functools import lru_cache
 from unittest.mock import Mock
 
 from bravado.exception import HTTPNotFound
@@ -30,6 +30,7 @@ TEST_STANDINGS_ALLIANCE_NAME = "Wayne Enterprises"
 # internal functions
 
 
+@lru_cache(maxsize=1)
 def _load_test_data():
     currentdir = os.path.dirname(
         os.path.abspath(inspect.getfile(inspect.currentframe()))
@@ -58,6 +59,24 @@ def _load_entities():
 _my_test_data = _load_test_data()
 _entities = _load_entities()
 
+# lookup tables for the esi stubs, built once at import
+_universe_names_by_id = {
+    entity["id"]: entity for entity in _my_test_data["esi_post_universe_names"]
+}
+_affiliations_by_character_id = {
+    assoc["character_id"]: assoc for assoc in _my_test_data["CharacterAffiliation"]
+}
+
+# entity classes supported by get_entity_data
+_ALLOWED_ENTITY_CLASSES = frozenset({EveCharacter, EveCorporationInfo, EveAllianceInfo})
+
+# eve entity category for each contact type in the test data
+_CATEGORY_BY_CONTACT_TYPE = {
+    "character": EveEntity.CATEGORY_CHARACTER,
+    "corporation": EveEntity.CATEGORY_CORPORATION,
+    "alliance": EveEntity.CATEGORY_ALLIANCE,
+}
+
 
 ##########################
 # common functions
@@ -70,18 +89,14 @@ def get_my_test_data() -> dict:
 
 def get_entity_name(entity_id: int):
     """returns name if entity is found, else None"""
-
-    if int(entity_id) in _entities:
-        return _entities[int(entity_id)]
-    else:
-        return None
+    return _entities.get(int(entity_id))
 
 
 def get_entity_names(eve_entity_ids: list) -> dict:
     """returns dict with {id: name} for found entities, else empty dict"""
     names_info = dict()
     for id in eve_entity_ids:
-        name = get_entity_name(id)
+        name = _entities.get(int(id))
         if name:
             names_info[id] = name
 
@@ -89,13 +104,15 @@ def get_entity_names(eve_entity_ids: list) -> dict:
 
 
 def get_entity_data(EntityClass: type, entity_id: int) -> object:
-    if EntityClass not in [EveCharacter, EveCorporationInfo, EveAllianceInfo]:
+    if EntityClass not in _ALLOWED_ENTITY_CLASSES:
         raise TypeError("Invalid entity_class: {}".format(EntityClass.__name__))
-    if str(entity_id) not in _my_test_data[EntityClass.__name__]:
+    key = str(entity_id)
+    table = _my_test_data[EntityClass.__name__]
+    if key not in table:
         raise ValueError(
             "not entity found in test data for that entity_id = {}".format(entity_id)
         )
-    return _my_test_data[EntityClass.__name__][str(entity_id)]
+    return table[key]
 
 
 def create_entity(EntityClass: type, entity_id: int) -> object:
@@ -109,21 +126,20 @@ def create_entity(EntityClass: type, entity_id: int) -> object:
 
 
 def esi_post_universe_names(ids, *args, **kwargs) -> object:
-    entities = list()
-    for entity in _my_test_data["esi_post_universe_names"]:
-        if entity["id"] in ids:
-            entities.append(entity)
-
+    entities = [
+        _universe_names_by_id[entity_id]
+        for entity_id in ids
+        if entity_id in _universe_names_by_id
+    ]
     return BravadoOperationStub(entities)
 
 
 def esi_post_characters_affiliation(characters, *args, **kwargs) -> object:
-    result = []
-    for assoc in _my_test_data["CharacterAffiliation"]:
-        if assoc["character_id"] in characters:
-            row = assoc.copy()
-            result.append(row)
-
+    result = [
+        _affiliations_by_character_id[character_id].copy()
+        for character_id in characters
+        if character_id in _affiliations_by_character_id
+    ]
     return BravadoOperationStub(result)
 
 
@@ -147,11 +163,16 @@ def esi_get_corporations_corporation_id(corporation_id, *args, **kwargs) -> obje
 
 
 def esi_get_alliances_alliance_id_contacts_labels(*args, **kwargs) -> object:
-    return BravadoOperationStub(deepcopy(_my_test_data["alliance_labels"]))
+    # shallow row copies suffice, the consumers never mutate nested values
+    return BravadoOperationStub(
+        [label.copy() for label in _my_test_data["alliance_labels"]]
+    )
 
 
 def esi_get_alliances_alliance_id_contacts(*args, **kwargs) -> object:
-    return BravadoOperationStub(deepcopy(_my_test_data["alliance_contacts"]))
+    return BravadoOperationStub(
+        [contact.copy() for contact in _my_test_data["alliance_contacts"]]
+    )
 
 
 ##########################
@@ -172,8 +193,12 @@ def create_standings_char():
     return character
 
 
+@lru_cache(maxsize=1)
 def get_test_labels() -> list:
-    """returns labels from test data as list of _ContactsWrapper.Label"""
+    """returns labels from test data as list of _ContactsWrapper.Label
+
+    The result is cached - callers must not mutate it.
+    """
     labels = list()
     for label_data in get_my_test_data()["alliance_labels"]:
         labels.append(_ContactsWrapper.Label(label_data))
@@ -181,15 +206,21 @@ def get_test_labels() -> list:
     return labels
 
 
+@lru_cache(maxsize=1)
 def get_test_contacts():
-    """returns contacts from test data as list of _ContactsWrapper.Contact"""
-    labels = get_test_labels()
+    """returns contacts from test data as list of _ContactsWrapper.Contact
+
+    The result is cached - callers must not mutate it.
+    """
+    labels_by_id = {label.id: label for label in get_test_labels()}
 
     contact_ids = [x["contact_id"] for x in get_my_test_data()["alliance_contacts"]]
     names_info = get_entity_names(contact_ids)
     contacts = list()
     for contact_data in get_my_test_data()["alliance_contacts"]:
-        contacts.append(_ContactsWrapper.Contact(contact_data, labels, names_info))
+        contacts.append(
+            _ContactsWrapper.Contact(contact_data, labels_by_id, names_info)
+        )
 
     return contacts
 
@@ -201,63 +232,80 @@ def create_contacts_set(my_set: ContactSet = None, include_assoc=True) -> Contac
 
     # add labels
     ContactSet.objects._add_labels_from_api(my_set, get_test_labels())
+    label_pk_by_id = {label.label_id: label.pk for label in my_set.labels.all()}
 
-    # create contacts for ContactSet
+    # create eve entities for contacts and characters in bulk
+    entity_candidates = []
     for contact in _my_test_data["alliance_contacts"]:
-        if contact["contact_type"] == "character":
-            category = EveEntity.CATEGORY_CHARACTER
-        elif contact["contact_type"] == "corporation":
-            category = EveEntity.CATEGORY_CORPORATION
-        elif contact["contact_type"] == "alliance":
-            category = EveEntity.CATEGORY_ALLIANCE
-        else:
+        if contact["contact_type"] not in _CATEGORY_BY_CONTACT_TYPE:
             raise ValueError("Invalid contact type")
-
-        eve_entity, _ = EveEntity.objects.get_or_create(
-            id=contact["contact_id"],
-            defaults={
-                "name": get_entity_name(contact["contact_id"]),
-                "category": category,
-            },
-        )
-        my_standing = Contact.objects.create(
-            contact_set=my_set,
-            eve_entity=eve_entity,
-            standing=contact["standing"],
+        entity_candidates.append(
+            (
+                contact["contact_id"],
+                get_entity_name(contact["contact_id"]),
+                _CATEGORY_BY_CONTACT_TYPE[contact["contact_type"]],
+            )
         )
-        for label_id in contact["label_ids"]:
-            my_standing.labels.add(my_set.labels.get(label_id=label_id))
-
-    # update EveEntity based on characters
-    for character_id, character_data in _my_test_data["EveCharacter"].items():
-        EveEntity.objects.get_or_create(
-            id=character_id,
-            defaults={
-                "name": character_data["character_name"],
-                "category": EveEntity.CATEGORY_CHARACTER,
-            },
+    for character_data in _my_test_data["EveCharacter"].values():
+        entity_candidates.append(
+            (
+                character_data["character_id"],
+                character_data["character_name"],
+                EveEntity.CATEGORY_CHARACTER,
+            )
         )
-        EveEntity.objects.get_or_create(
-            id=character_data["corporation_id"],
-            defaults={
-                "name": character_data["corporation_name"],
-                "category": EveEntity.CATEGORY_CORPORATION,
-            },
+        entity_candidates.append(
+            (
+                character_data["corporation_id"],
+                character_data["corporation_name"],
+                EveEntity.CATEGORY_CORPORATION,
+            )
         )
         if character_data["alliance_id"]:
-            EveEntity.objects.get_or_create(
-                id=character_data["alliance_id"],
-                defaults={
-                    "name": character_data["alliance_name"],
-                    "category": EveEntity.CATEGORY_ALLIANCE,
-                },
+            entity_candidates.append(
+                (
+                    character_data["alliance_id"],
+                    character_data["alliance_name"],
+                    EveEntity.CATEGORY_ALLIANCE,
+                )
             )
 
+    existing_entity_ids = set(EveEntity.objects.values_list("id", flat=True))
+    new_entities = []
+    for entity_id, name, category in entity_candidates:
+        if int(entity_id) not in existing_entity_ids:
+            new_entities.append(EveEntity(id=entity_id, name=name, category=category))
+            existing_entity_ids.add(int(entity_id))
+    EveEntity.objects.bulk_create(new_entities)
+
+    # create contacts for ContactSet with their labels in bulk
+    Contact.objects.bulk_create(
+        Contact(
+            contact_set=my_set,
+            eve_entity_id=contact["contact_id"],
+            standing=contact["standing"],
+        )
+        for contact in _my_test_data["alliance_contacts"]
+    )
+    contact_pk_by_entity_id = dict(my_set.contacts.values_list("eve_entity_id", "pk"))
+    Contact.labels.through.objects.bulk_create(
+        Contact.labels.through(
+            contact_id=contact_pk_by_entity_id[contact["contact_id"]],
+            contactlabel_id=label_pk_by_id[label_id],
+        )
+        for contact in _my_test_data["alliance_contacts"]
+        for label_id in contact["label_ids"]
+    )
+
     # create CharacterAffiliation
     if include_assoc:
-        CharacterAffiliation.objects.all().delete()
-        for assoc in _my_test_data["CharacterAffiliation"]:
-            CharacterAffiliation.objects.create(**assoc)
+        CharacterAffiliation.objects.bulk_create(
+            (
+                CharacterAffiliation(**assoc)
+                for assoc in _my_test_data["CharacterAffiliation"]
+            ),
+            ignore_conflicts=True,
+        )
 
     return my_set
 
@@ -267,29 +315,38 @@ def create_eve_objects():
     EveCharacter.objects.all().delete()
     EveCorporationInfo.objects.all().delete()
     EveAllianceInfo.objects.all().delete()
-    for character_data in _my_test_data[EveCharacter.__name__].values():
-        character = EveCharacter.objects.create(**character_data)
-        if character.alliance_id:
-            defaults = {
-                "alliance_name": character.alliance_name,
-                "alliance_ticker": character.alliance_ticker,
-                "executor_corp_id": 2001,
-            }
-            alliance, _ = EveAllianceInfo.objects.get_or_create(
-                alliance_id=character.alliance_id, defaults=defaults
+    characters = [
+        EveCharacter(**character_data)
+        for character_data in _my_test_data[EveCharacter.__name__].values()
+    ]
+    EveCharacter.objects.bulk_create(characters)
+
+    new_alliances = dict()
+    for character in characters:
+        if character.alliance_id and character.alliance_id not in new_alliances:
+            new_alliances[character.alliance_id] = EveAllianceInfo(
+                alliance_id=character.alliance_id,
+                alliance_name=character.alliance_name,
+                alliance_ticker=character.alliance_ticker,
+                executor_corp_id=2001,
             )
-        else:
-            alliance = None
-
-        defaults = {
-            "corporation_name": character.corporation_name,
-            "corporation_ticker": character.corporation_ticker,
-            "member_count": 99,
-            "alliance": alliance,
-        }
-        EveCorporationInfo.objects.get_or_create(
-            corporation_id=character.corporation_id, defaults=defaults
-        )
+    EveAllianceInfo.objects.bulk_create(new_alliances.values())
+    # refetch, since bulk_create does not return pks on all backends
+    alliance_by_id = {
+        alliance.alliance_id: alliance for alliance in EveAllianceInfo.objects.all()
+    }
+
+    new_corporations = dict()
+    for character in characters:
+        if character.corporation_id not in new_corporations:
+            new_corporations[character.corporation_id] = EveCorporationInfo(
+                corporation_id=character.corporation_id,
+                corporation_name=character.corporation_name,
+                corporation_ticker=character.corporation_ticker,
+                member_count=99,
+                alliance=alliance_by_id.get(character.alliance_id),
+            )
+    EveCorporationInfo.objects.bulk_create(new_corporations.values())
 
 
 def add_eve_object_to_eve_entities(obj: object):
@@ -378,46 +435,50 @@ def generate_eve_entities_from_allianceauth():
         )
 
 
-def load_eve_entities():
+@lru_cache(maxsize=1)
+def _eve_entity_rows() -> tuple:
+    """returns the (id, name, category) rows for all entities in the test data
+
+    Only the constant row specs are cached, never model instances.
+    """
+    rows = dict()
     for character in _my_test_data["EveCharacter"].values():
-        EveEntity.objects.get_or_create(
-            id=character["character_id"],
-            defaults={
-                "name": character["character_name"],
-                "category": EveEntity.CATEGORY_CHARACTER,
-            },
+        rows.setdefault(
+            character["character_id"],
+            (character["character_name"], EveEntity.CATEGORY_CHARACTER),
         )
-        EveEntity.objects.get_or_create(
-            id=character["corporation_id"],
-            defaults={
-                "name": character["corporation_name"],
-                "category": EveEntity.CATEGORY_CORPORATION,
-            },
+        rows.setdefault(
+            character["corporation_id"],
+            (character["corporation_name"], EveEntity.CATEGORY_CORPORATION),
         )
         if character["alliance_id"]:
-            EveEntity.objects.get_or_create(
-                id=character["alliance_id"],
-                defaults={
-                    "name": character["alliance_name"],
-                    "category": EveEntity.CATEGORY_ALLIANCE,
-                },
+            rows.setdefault(
+                character["alliance_id"],
+                (character["alliance_name"], EveEntity.CATEGORY_ALLIANCE),
             )
     for corporation in _my_test_data["EveCorporationInfo"].values():
-        EveEntity.objects.get_or_create(
-            id=corporation["corporation_id"],
-            defaults={
-                "name": corporation["corporation_name"],
-                "category": EveEntity.CATEGORY_CORPORATION,
-            },
+        rows.setdefault(
+            corporation["corporation_id"],
+            (corporation["corporation_name"], EveEntity.CATEGORY_CORPORATION),
         )
     for alliance in _my_test_data["EveAllianceInfo"].values():
-        EveEntity.objects.get_or_create(
-            id=alliance["alliance_id"],
-            defaults={
-                "name": alliance["alliance_name"],
-                "category": EveEntity.CATEGORY_ALLIANCE,
-            },
+        rows.setdefault(
+            alliance["alliance_id"],
+            (alliance["alliance_name"], EveEntity.CATEGORY_ALLIANCE),
         )
+    return tuple(
+        (entity_id, name, category) for entity_id, (name, category) in rows.items()
+    )
+
+
+def load_eve_entities():
+    EveEntity.objects.bulk_create(
+        (
+            EveEntity(id=entity_id, name=name, category=category)
+            for entity_id, name, category in _eve_entity_rows()
+        ),
+        ignore_conflicts=True,
+    )
 
 
 def load_corporation_details():
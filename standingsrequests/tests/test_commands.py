@@ -39,10 +39,12 @@ class TestSyncRequests(NoSocketsTestCase):
             StandingRequest.REQUEST_PERMISSION_NAME, cls.user
         )
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         create_standings_char()
-        self.contacts_set = create_contacts_set()
-        StandingRequest.objects.all().delete()
+        cls.contacts_set = create_contacts_set()
+
+    def setUp(self):
         self.out = StringIO()
 
     def test_abort_if_input_is_not_y(self, mock_get_input):
@@ -38,6 +38,37 @@ CORE_PATH = "standingsrequests.core"
 MANAGERS_PATH = "standingsrequests.managers"
 MODELS_PATH = "standingsrequests.models"
 TEST_USER_NAME = "Peter Parker"
+# built once; the payload is never introspected by the code under test
+HTTP_ERROR = HTTPError(Mock())
+# expected end states shared across test runs - treat as read-only
+EXPECTED_LABELS = [(1, "blue"), (2, "green"), (3, "yellow"), (4, "red")]
+EXPECTED_CONTACTS = [
+    (1001, 10),
+    (1002, 10),
+    (1003, 5),
+    (1004, 0.01),
+    (1005, 0),
+    (1006, 0),
+    (1008, -5),
+    (1009, -10),
+    (1010, 5),
+    (1110, 5.0),
+    (2001, 10.0),
+    (2003, 5.0),
+    (2102, -10.0),
+    (3010, -10.0),
+]
+EXPECTED_AFFILIATION_CHARACTER_IDS = [
+    1001,
+    1002,
+    1003,
+    1004,
+    1005,
+    1006,
+    1008,
+    1009,
+    1010,
+]
 
 
 class TestContactSetManager(NoSocketsTestCase):
@@ -66,31 +97,18 @@ class TestContactSetManager(NoSocketsTestCase):
 
         # labels
         contact_set = ContactSet.objects.create_new_from_api()
-        labels = set(contact_set.labels.values_list("label_id", "name"))
-        expected = {(1, "blue"), (2, "green"), (3, "yellow"), (4, "red")}
-        self.assertSetEqual(labels, expected)
+        labels = list(
+            contact_set.labels.order_by("label_id").values_list("label_id", "name")
+        )
+        self.assertListEqual(labels, EXPECTED_LABELS)
 
         # all_contacts
-        all_contacts = set(
-            contact_set.contacts.values_list("eve_entity_id", "standing")
-        )
-        expected = {
-            (1001, 10),
-            (1002, 10),
-            (1003, 5),
-            (1004, 0.01),
-            (1005, 0),
-            (1006, 0),
-            (1008, -5),
-            (1009, -10),
-            (1010, 5),
-            (1110, 5.0),
-            (2001, 10.0),
-            (2003, 5.0),
-            (2102, -10.0),
-            (3010, -10.0),
-        }
-        self.assertSetEqual(all_contacts, expected)
+        all_contacts = list(
+            contact_set.contacts.order_by("eve_entity_id").values_list(
+                "eve_entity_id", "standing"
+            )
+        )
+        self.assertListEqual(all_contacts, EXPECTED_CONTACTS)
 
     @patch(CORE_PATH + ".STANDINGS_API_CHARID", TEST_STANDINGS_API_CHARID)
     def test_standings_character_exists(self):
@@ -113,14 +131,17 @@ class TestContactSetManager(NoSocketsTestCase):
         self.assertTrue(EveEntity.objects.filter(id=TEST_STANDINGS_API_CHARID).exists())
 
 
-class TestAbstractStandingsRequestManager(NoSocketsTestCase):
+class RequestManagerTestBase(NoSocketsTestCase):
+    """Shared class-level fixture for the request manager test classes."""
+
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         create_contacts_set()
         cls.user_requestor = AuthUtils.create_member("Bruce Wayne")
         cls.user_manager = AuthUtils.create_user("Mike Manager")
 
+
+class TestAbstractStandingsRequestManager(RequestManagerTestBase):
     def test_pending_requests_empty(self):
         self.assertEqual(StandingRequest.objects.pending_requests().count(), 0)
 
@@ -150,19 +171,51 @@ class TestAbstractStandingsRequestManager(NoSocketsTestCase):
         # then
         self.assertEqual(result.count(), 1)
 
+    def test_should_return_contact_ids_with_pending_request_in_bulk(self):
+        # given
+        StandingRequest.objects.create(
+            user=self.user_requestor,
+            contact_id=1001,
+            contact_type_id=CHARACTER_TYPE_ID,
+            is_effective=False,
+        )
+        StandingRequest.objects.create(
+            user=self.user_requestor,
+            contact_id=1002,
+            contact_type_id=CHARACTER_TYPE_ID,
+            is_effective=True,
+        )
+        StandingRequest.objects.create(
+            user=self.user_requestor,
+            contact_id=1003,
+            contact_type_id=CHARACTER_TYPE_ID,
+            is_effective=False,
+            action_date=now(),
+        )
+        # when
+        result = StandingRequest.objects.has_pending_request_bulk(
+            [1001, 1002, 1003, 1004]
+        )
+        # then
+        self.assertSetEqual(result, {1001})
+
+
+class ProcessRequestsTestBase(NoSocketsTestCase):
+    """Shared class-level fixture for the process requests test classes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user_manager = AuthUtils.create_user("Mike Manager")
+        cls.user_requestor = AuthUtils.create_user("Roger Requestor")
+        cls.contact_set = create_contacts_set()
+        create_standings_char()
+
 
 @patch(MANAGERS_PATH + ".SR_NOTIFICATIONS_ENABLED", True)
 @patch(CORE_PATH + ".STANDINGS_API_CHARID", TEST_STANDINGS_API_CHARID)
 @patch(MODELS_PATH + ".SR_STANDING_TIMEOUT_HOURS", 24)
 @patch(MANAGERS_PATH + ".notify")
-class TestAbstractStandingsRequestProcessRequests(NoSocketsTestCase):
-    def setUp(self):
-        self.user_manager = AuthUtils.create_user("Mike Manager")
-        self.user_requestor = AuthUtils.create_user("Roger Requestor")
-        ContactSet.objects.all().delete()
-        self.contact_set = create_contacts_set()
-        create_standings_char()
-
+class TestAbstractStandingsRequestProcessRequests(ProcessRequestsTestBase):
     def test_when_pilot_standing_satisfied_in_game_mark_effective_and_inform_user(
         self, mock_notify
     ):
@@ -283,14 +336,7 @@ class TestAbstractStandingsRequestProcessRequests(NoSocketsTestCase):
         self.assertFalse(AbstractStandingsRequest.objects.has_pending_request(1002))
 
 
-class TestAbstractStandingsRequestAnnotations(NoSocketsTestCase):
-    def setUp(self):
-        self.user_manager = AuthUtils.create_user("Mike Manager")
-        self.user_requestor = AuthUtils.create_user("Roger Requestor")
-        ContactSet.objects.all().delete()
-        self.contact_set = create_contacts_set()
-        create_standings_char()
-
+class TestAbstractStandingsRequestAnnotations(ProcessRequestsTestBase):
     def test_pending_request_annotation(self):
         # given
         r1 = StandingRequest.objects.create(
@@ -316,15 +362,11 @@ class TestAbstractStandingsRequestAnnotations(NoSocketsTestCase):
 
 
 @patch(MODELS_PATH + ".StandingRequest.can_request_corporation_standing")
-class TestStandingsRequestValidateRequests(NoSocketsTestCase):
+class TestStandingsRequestValidateRequests(RequestManagerTestBase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        create_contacts_set()
-        cls.user = AuthUtils.create_member("Bruce Wayne")
-
-    def setUp(self):
-        StandingRequest.objects.all().delete()
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = cls.user_requestor
 
     def test_do_nothing_character_request_is_valid(
         self, mock_can_request_corporation_standing
@@ -383,14 +425,7 @@ class TestStandingsRequestValidateRequests(NoSocketsTestCase):
         self.assertTrue(StandingRequest.objects.filter(pk=request.pk).exists())
 
 
-class TestStandingsRequestManager(NoSocketsTestCase):
-    @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        create_contacts_set()
-        cls.user_requestor = AuthUtils.create_member("Bruce Wayne")
-        cls.user_manager = AuthUtils.create_user("Mike Manager")
-
+class TestStandingsRequestManager(RequestManagerTestBase):
     def test_should_add_new_request(self):
         # when
         my_request = StandingRequest.objects.get_or_create_2(
@@ -413,18 +448,23 @@ class TestStandingsRequestManager(NoSocketsTestCase):
 
 
 class TestStandingsRevocationManager(NoSocketsTestCase):
-    def setUp(self):
-        ContactSet.objects.all().delete()
+    @classmethod
+    def setUpTestData(cls):
         load_eve_entities()
         my_set = ContactSet.objects.create(name="Dummy Set")
-        Contact.objects.create(contact_set=my_set, eve_entity_id=1001, standing=10)
-        Contact.objects.create(contact_set=my_set, eve_entity_id=1002, standing=5)
-        Contact.objects.create(contact_set=my_set, eve_entity_id=1003, standing=0.01)
-        Contact.objects.create(contact_set=my_set, eve_entity_id=1005, standing=0)
-        Contact.objects.create(contact_set=my_set, eve_entity_id=1008, standing=-5)
-        Contact.objects.create(contact_set=my_set, eve_entity_id=1009, standing=-10)
-        self.user_manager = AuthUtils.create_user("Mike Manager")
-        self.user_requestor = AuthUtils.create_user("Roger Requestor")
+        Contact.objects.bulk_create(
+            Contact(contact_set=my_set, eve_entity_id=eve_entity_id, standing=standing)
+            for eve_entity_id, standing in [
+                (1001, 10),
+                (1002, 5),
+                (1003, 0.01),
+                (1005, 0),
+                (1008, -5),
+                (1009, -10),
+            ]
+        )
+        cls.user_manager = AuthUtils.create_user("Mike Manager")
+        cls.user_requestor = AuthUtils.create_user("Roger Requestor")
 
     def test_add_revocation_new(self):
         my_revocation = StandingRevocation.objects.add_revocation(
@@ -482,12 +522,12 @@ class TestCharacterAffiliationsManager(NoSocketsTestCase):
         # when
         CharacterAffiliation.objects.update_from_esi()
         # then
-        existing_objects = set(
-            CharacterAffiliation.objects.values_list("character_id", flat=True)
-        )
-        self.assertSetEqual(
-            existing_objects, {1001, 1002, 1003, 1004, 1005, 1006, 1008, 1009, 1010}
+        existing_objects = list(
+            CharacterAffiliation.objects.order_by("character_id").values_list(
+                "character_id", flat=True
+            )
         )
+        self.assertListEqual(existing_objects, EXPECTED_AFFILIATION_CHARACTER_IDS)
 
     def test_should_update_existing_assocs(self, mock_esi):
         # given
@@ -501,21 +541,18 @@ class TestCharacterAffiliationsManager(NoSocketsTestCase):
         # when
         CharacterAffiliation.objects.update_from_esi()
         # then
-        existing_objects = set(
-            CharacterAffiliation.objects.values_list("character_id", flat=True)
-        )
-        self.assertSetEqual(
-            existing_objects,
-            {1001, 1002, 1003, 1004, 1005, 1006, 1008, 1009, 1010},
+        existing_objects = list(
+            CharacterAffiliation.objects.order_by("character_id").values_list(
+                "character_id", flat=True
+            )
         )
+        self.assertListEqual(existing_objects, EXPECTED_AFFILIATION_CHARACTER_IDS)
         assoc.refresh_from_db()
         self.assertEqual(assoc.corporation_id, 2001)
 
     def test_should_handle_exception_from_api(self, mock_esi):
         # given
-        mock_esi.client.Character.post_characters_affiliation.side_effect = HTTPError(
-            Mock()
-        )
+        mock_esi.client.Character.post_characters_affiliation.side_effect = HTTP_ERROR
         create_contacts_set(include_assoc=False)
         # when
         CharacterAffiliation.objects.update_from_esi()
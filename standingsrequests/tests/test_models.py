@@ -83,20 +83,20 @@ class TestContactSetCreateStanding(NoSocketsTestCase):
 
     def test_can_create_pilot_standing(self):
         obj = Contact.objects.create(
-            contact_set=self.contact_set, eve_entity_id=1009, standing=-10
+            contact_set=self.contact_set, eve_entity_id=1007, standing=-10
         )
         obj.labels.add(*ContactLabel.objects.all())
         self.assertIsInstance(obj, Contact)
-        self.assertEqual(obj.eve_entity_id, 1009)
+        self.assertEqual(obj.eve_entity_id, 1007)
         self.assertEqual(obj.standing, -10)
 
     def test_can_create_corp_standing(self):
         obj = Contact.objects.create(
-            contact_set=self.contact_set, eve_entity_id=2102, standing=-10
+            contact_set=self.contact_set, eve_entity_id=2004, standing=-10
         )
         obj.labels.add(*ContactLabel.objects.all())
         self.assertIsInstance(obj, Contact)
-        self.assertEqual(obj.eve_entity_id, 2102)
+        self.assertEqual(obj.eve_entity_id, 2004)
         self.assertEqual(obj.standing, -10)
 
     def test_can_create_alliance_standing(self):
@@ -94,6 +94,11 @@ def request_characters(request):
             ).annotate_is_pending()
         )
     }
+    characters_with_required_scopes = (
+        StandingRequest.characters_with_required_scopes_for_request(
+            eve_characters.values(), user=request.user, quick_check=True
+        )
+    )
     characters_data = list()
     for character in eve_characters.values():
         character_id = character.character_id
@@ -123,9 +128,7 @@ def request_characters(request):
                 "pendingRevocation": has_pending_revocation,
                 "requestActioned": has_actioned_request,
                 "inOrganisation": MainOrganizations.is_character_a_member(character),
-                "hasRequiredScopes": StandingRequest.has_required_scopes_for_request(
-                    character, user=request.user, quick_check=True
-                ),
+                "hasRequiredScopes": character_id in characters_with_required_scopes,
                 "hasStanding": has_standing,
             }
         )
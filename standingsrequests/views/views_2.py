@@ -167,7 +167,12 @@ def download_pilot_standings(request):
     )
 
     # lets request make sure all info is there in bulk
-    character_contacts = contacts.contacts.all().order_by("eve_entity__name")
+    character_contacts = (
+        contacts.contacts.all()
+        .with_names()
+        .prefetch_related("labels")
+        .order_by("eve_entity__name")
+    )
     EveEntity.objects.bulk_resolve_names([p.contact_id for p in character_contacts])
 
     for pilot_standing in character_contacts:
@@ -178,7 +183,9 @@ def download_pilot_standings(request):
         main = ""
         state = ""
         try:
-            ownership = CharacterOwnership.objects.get(character=char)
+            ownership = CharacterOwnership.objects.select_related(
+                "user__profile__state", "user__profile__main_character"
+            ).get(character=char)
             state = ownership.user.profile.state.name
             main = ownership.user.profile.main_character
             if main is None: